@@ -0,0 +1,124 @@
+"""File-backed cache for fetched DataFrames"""
+import datetime
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "economics")
+
+logger = logging.getLogger(__name__)
+
+class FileCache:
+    """Pickled DataFrames in one directory, with an in-process copy of each entry
+
+    Entries expire by file age, so no separate metadata is needed: the file's
+    mtime is when it was fetched.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR):
+        """
+        Args:
+            directory (str): Directory holding the cache files
+        """
+        self.directory = directory
+        self._memory = {}  # path -> (fetched at, DataFrame)
+
+    def path(self, name: str, key_parts: tuple) -> str:
+        """Get the file path for an entry
+
+        Args:
+            name (str): Readable prefix for the file name
+            key_parts (tuple): Values identifying the entry
+
+        Returns:
+            str: Path of the cache file
+        """
+        key = hashlib.md5(repr(key_parts).encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}_{key}.pkl")
+
+    def get(self, path: str, ttl: datetime.timedelta):
+        """Get an entry if it is younger than ``ttl``
+
+        Args:
+            path (str): Path returned by ``path()``
+            ttl (datetime.timedelta): How long an entry stays valid
+
+        Returns:
+            pd.DataFrame | None: Copy of the cached DataFrame, or None on a miss
+        """
+        now = time.time()
+        entry = self._memory.get(path)
+        if entry is not None and now - entry[0] < ttl.total_seconds():
+            return entry[1].copy()
+
+        if os.path.exists(path) and now - os.path.getmtime(path) < ttl.total_seconds():
+            try:
+                data = pd.read_pickle(path)
+                self._memory[path] = (os.path.getmtime(path), data)
+                return data.copy()
+            except Exception:
+                pass  # Unreadable cache entry, treat as a miss
+        return None
+
+    def put(self, path: str, data: pd.DataFrame):
+        """Store an entry in memory and on disk
+
+        Writing to disk is best-effort: if it fails the entry is kept in memory
+        only, so a cache problem never fails a fetch that succeeded.
+
+        Args:
+            path (str): Path returned by ``path()``
+            data (pd.DataFrame): DataFrame to cache
+        """
+        self._memory[path] = (time.time(), data)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # A temp file unique to this call, so threads and processes writing the same
+            # key never share one; the rename is atomic, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as e:
+            logger.debug("Not caching %s on disk: %s", path, e)
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                data.to_pickle(f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Not caching %s on disk: %s", path, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Already gone, nothing to clean up
+
+FILE_CACHE = FileCache()
+
+def cached(ttl: datetime.timedelta, cache: FileCache = FILE_CACHE):
+    """Cache the DataFrame returned by a fetch function in memory and on disk
+
+    Results are keyed by function name, arguments (including the fetch window)
+    and today's date and reused until they are older than ``ttl``, so repeat
+    runs skip the network entirely and repeat menu choices within one session
+    skip the disk as well. Callers get a copy, so they may modify it freely.
+
+    Args:
+        ttl (datetime.timedelta): How long a cached result stays valid
+        cache (FileCache): Cache to store results in
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key_parts = (func.__name__, args, sorted(kwargs.items()), datetime.date.today().isoformat())
+            path = cache.path(func.__name__, key_parts)
+            data = cache.get(path, ttl)
+            if data is not None:
+                return data
+            data = func(*args, **kwargs)
+            cache.put(path, data)
+            return data.copy()
+        return wrapper
+    return decorator
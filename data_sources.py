@@ -0,0 +1,282 @@
+"""Fetch Yahoo Finance and FRED data, caching results on disk"""
+import datetime
+import functools
+import json
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+from cache import cached
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the standard library parser
+    _json_loads = json.loads
+
+YAHOO_CACHE_TTL = datetime.timedelta(hours=6)
+FRED_CACHE_TTL = datetime.timedelta(hours=24)  # FRED series here are monthly
+
+logger = logging.getLogger(__name__)
+
+class NoDataError(ValueError):
+    """Yahoo Finance returned no rows for a request
+
+    yfinance logs network failures and returns an empty frame (or all-NaN
+    columns from download) instead of raising, so an empty response is the
+    only sign of a transient Yahoo outage and is retried like one.
+    """
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a failed network call is worth retrying
+
+    Args:
+        error (Exception): Exception raised by the call
+
+    Returns:
+        bool: True for connection errors, timeouts, rate limits, server errors
+            and empty Yahoo responses
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status == 429 or (status is not None and status >= 500)
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, NoDataError)):
+        return True
+    # yfinance's network stack (curl_cffi) and its rate-limit error; these can only
+    # have been raised if yfinance is already loaded, so never import them here
+    curl_errors = sys.modules.get("curl_cffi.requests.exceptions")
+    if curl_errors is not None and isinstance(error, (curl_errors.ConnectionError, curl_errors.Timeout)):
+        return True
+    yf_errors = sys.modules.get("yfinance.exceptions")
+    return yf_errors is not None and isinstance(error, yf_errors.YFRateLimitError)
+
+def retry(attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+    """Retry a network call with exponential backoff on transient errors
+
+    Other errors (bad API key, malformed request, ...) are raised immediately,
+    as is the last transient error once the attempts run out. An unknown
+    ticker looks like an empty Yahoo response, so it uses up the attempts.
+
+    Args:
+        attempts (int): Total number of calls to make
+        base_delay (float): Seconds to wait before the first retry, doubled on each retry
+        max_delay (float): Upper bound on the wait between retries in seconds
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts or not _is_transient(e):
+                        raise
+                    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+                    logger.debug("%s failed (%s), retrying in %.1fs", func.__name__, e, delay)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+def fetch_start_date(today: datetime.date, years: int) -> str:
+    """Get the first date of a fetch window ending today
+
+    Args:
+        today (datetime.date): Last day of the window
+        years (int): Number of years requested; one year fetches an extra year
+            so a full year of YoY changes is available
+
+    Returns:
+        str: Start date formatted as YYYY-MM-DD
+    """
+    fetch_years = years + 1 if years == 1 else years
+    return (today - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
+
+def strip_tz(data: pd.DataFrame) -> pd.DataFrame:
+    """Make a DataFrame's index timezone-naive in place, keeping local wall times
+
+    tz_localize(None) rather than tz_convert(None): converting would move
+    Yahoo's midnight exchange-time bars to 04:00/05:00 UTC, off the
+    midnight dates FRED uses. Naive indexes are left untouched.
+
+    Args:
+        data (pd.DataFrame): DataFrame with a DatetimeIndex
+
+    Returns:
+        pd.DataFrame: The same DataFrame
+    """
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    return data
+
+@retry()
+def _yahoo_history(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Fetch one ticker's daily history from Yahoo Finance
+
+    Args:
+        ticker (str): Ticker symbol
+        start_date (str): First date to fetch as YYYY-MM-DD
+        end_date (str): Last date to fetch as YYYY-MM-DD
+
+    Returns:
+        pd.DataFrame: yfinance history frame
+
+    Raises:
+        NoDataError: If Yahoo Finance returned no rows
+    """
+    import yfinance as yf
+
+    data = yf.Ticker(ticker).history(start=start_date, end=end_date)
+    if data.empty:
+        raise NoDataError("No data returned from Yahoo Finance")
+    return data
+
+@retry()
+def _yahoo_download(tickers: tuple, start_date: str, end_date: str) -> pd.DataFrame:
+    """Fetch several tickers' daily history from Yahoo Finance in one batch
+
+    Args:
+        tickers (tuple): Ticker symbols
+        start_date (str): First date to fetch as YYYY-MM-DD
+        end_date (str): Last date to fetch as YYYY-MM-DD
+
+    Returns:
+        pd.DataFrame: yfinance download frame with one column group per ticker
+
+    Raises:
+        NoDataError: If Yahoo Finance returned no rows for any of the tickers
+    """
+    import yfinance as yf
+
+    data = yf.download(list(tickers), start=start_date, end=end_date, group_by="ticker",
+                       threads=True, ignore_tz=True, progress=False)
+    if data is None or data.empty:
+        raise NoDataError("No data returned from Yahoo Finance")
+    # yf.download reports per-ticker failures as all-NaN columns rather than raising
+    missing = [t for t in tickers if t not in data.columns.get_level_values(0) or data[t]["Close"].isna().all()]
+    if missing:
+        raise NoDataError(f"No data returned for {', '.join(missing)}")
+    return data
+
+@cached(ttl=YAHOO_CACHE_TTL)
+def get_kbe_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Get KBE ETF data from Yahoo Finance
+    
+    Args:
+        ticker (str): ETF ticker symbol
+        start_date (str): First date to fetch as YYYY-MM-DD
+        end_date (str): Last date to fetch as YYYY-MM-DD
+
+    Returns:
+        pd.DataFrame: DataFrame containing KBE historical data
+    
+    Raises:
+        Exception: If there's an error fetching data from Yahoo Finance
+    """
+    try:
+        data = _yahoo_history(ticker, start_date, end_date)
+        strip_tz(data)  # make data timezone-naive for easier manipulation
+        # Only the close is used downstream; float32 holds ETF prices with room to spare
+        return data[["Close"]].astype(np.float32)
+    except Exception as e:
+        raise Exception(f"Failed to fetch KBE data: {str(e)}")
+
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# FRED series used by the plots: series id -> column name
+FRED_SERIES = {
+    "HSN1F": "New Home Sales",
+    "HOUST": "Housing Starts",
+    "GS10": "10-Year Treasury",
+}
+
+# Shared session so repeated and concurrent FRED calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4))
+FRED_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+@functools.lru_cache(maxsize=1)
+def _fred_api_key() -> str:
+    """Get the FRED API key, reading the environment once per process
+
+    Returns:
+        str: FRED API key
+
+    Raises:
+        ValueError: If FRED_API_KEY is not set in environment variables
+    """
+    fred_api_key = os.getenv("FRED_API_KEY")
+    if not fred_api_key:
+        raise ValueError("FRED_API_KEY environment variable is not set")
+    return fred_api_key
+
+@retry()
+def _fred_series(series_id: str, column: str, start_date: str, api_key: str) -> pd.DataFrame:
+    """Fetch a FRED series directly from the observations endpoint
+
+    Args:
+        series_id (str): FRED series identifier (e.g. "HSN1F")
+        column (str): Column name for the observation values
+        start_date (str): First observation date as YYYY-MM-DD
+        api_key (str): FRED API key
+
+    Returns:
+        pd.DataFrame: Single-column DataFrame indexed by observation date
+    """
+    params = {
+        "series_id": series_id,
+        "observation_start": start_date,
+        "api_key": api_key,
+        "file_type": "json",
+    }
+    response = SESSION.get(FRED_OBSERVATIONS_URL, params=params, timeout=FRED_TIMEOUT)
+    response.raise_for_status()
+    observations = _json_loads(response.content)["observations"]
+    records = pd.DataFrame.from_records(observations, columns=["date", "value"])
+    index = pd.to_datetime(records["date"].to_numpy(), format="%Y-%m-%d", cache=True)
+    # FRED marks missing observations with ".", which coerces to NaN. float32 holds
+    # FRED's published precision and halves memory for every later step
+    values = pd.to_numeric(records["value"], errors="coerce").to_numpy(dtype=np.float32)
+    return pd.DataFrame({column: values}, index=index)
+
+@cached(ttl=FRED_CACHE_TTL)
+def get_fred_series(series_id: str, start_date: str) -> pd.DataFrame:
+    """Get a FRED series listed in FRED_SERIES
+    Args:
+        series_id (str): FRED series identifier, a key of FRED_SERIES
+        start_date (str): First observation date as YYYY-MM-DD
+    Returns:
+        pd.DataFrame: DataFrame with one column named after the series
+    Raises:
+        ValueError: If FRED_API_KEY is not set in environment variables
+        Exception: For any FRED API related errors
+    """
+    fred_api_key = _fred_api_key()
+    try:
+        return _fred_series(series_id, FRED_SERIES[series_id], start_date, fred_api_key)
+    except Exception as e:
+        raise Exception(f"Failed to fetch FRED data: {str(e)}")
+
+@cached(ttl=YAHOO_CACHE_TTL)
+def get_etfs_data(tickers: tuple, start_date: str, end_date: str) -> pd.DataFrame:
+    """Get data for several ETFs from Yahoo Finance with one batched download
+    
+    Args:
+        tickers (tuple): ETF ticker symbols
+        start_date (str): First date to fetch as YYYY-MM-DD
+        end_date (str): Last date to fetch as YYYY-MM-DD
+        
+    Returns:
+        pd.DataFrame: DataFrame containing historical data with one column group per ticker
+    """
+    try:
+        data = _yahoo_download(tickers, start_date, end_date)
+        strip_tz(data)  # no-op when ignore_tz already returned a naive index
+        # Only the close is used downstream; float32 holds ETF prices with room to spare
+        return data.xs("Close", axis=1, level=1, drop_level=False).astype(np.float32)
+    except Exception as e:
+        raise Exception(f"Failed to fetch {', '.join(tickers)} data: {str(e)}")
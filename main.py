@@ -1,129 +1,59 @@
-import yfinance as yf
-import fredapi
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import urllib3
-import ssl
 import datetime
+import functools
+import logging
 import os
-from dotenv import load_dotenv
+import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-# Disable SSL verification warnings
-ssl._create_default_https_context = ssl._create_unverified_context
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from data_sources import (
+    FRED_SERIES,
+    fetch_start_date,
+    get_etfs_data,
+    get_fred_series,
+    get_kbe_data,
+)
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 # Function to check if running in a Dev Container
 def is_devcontainer():
     """Check if the script is running inside a Dev Container."""
     return os.path.exists("/.dockerenv") or "DEV_CONTAINER" in os.environ
 
-def get_kbe_data(ticker: str="KBE", years: int=10) -> pd.DataFrame:
-    """Get KBE ETF data from Yahoo Finance
-    
-    Returns:
-        pd.DataFrame: DataFrame containing KBE historical data
-    
-    Raises:
-        Exception: If there's an error fetching data from Yahoo Finance
-    """
-    try:
-        fetch_years = years + 1 if years == 1 else years # fetch an extra year when only 1 year is requested
-
-        # Calculate start date for Yahoo Finance call
-        end_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-
-        kbe = yf.Ticker(ticker)
-        data = kbe.history(start=start_date, end=end_date)
-        data.index = data.index.tz_localize(None) # make data timezone-naive for easier manipulation
-        if data.empty:
-            raise ValueError("No data returned from Yahoo Finance")
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch KBE data: {str(e)}")
-
-def get_new_home_sales_data(years: int) -> pd.DataFrame:
-    """Get new home sales data from FRED
-    Returns:
-        pd.DataFrame: DataFrame containing new home sales data
-    Raises:
-        ValueError: If FRED_API_KEY is not set in environment variables
-        Exception: For any FRED API related errors
-    """
-    fred_api_key = os.getenv("FRED_API_KEY")
-    if not fred_api_key:
-        raise ValueError("FRED_API_KEY environment variable is not set")
-    try:
-        fred = fredapi.Fred(api_key=fred_api_key)
-        fetch_years = years + 1 if years == 1 else years  # Fetch an extra year when years=1
-        # Calculate start date
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-        data = fred.get_series("HSN1F", observation_start=start_date)
-        data = pd.DataFrame(data, columns=["New Home Sales"])
-        data.index = pd.to_datetime(data.index)
-        data.index = data.index.tz_localize(None)  # Make dates timezone naive
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch FRED data: {str(e)}")
-
-def get_housing_starts_data(years: int) -> pd.DataFrame:
-    """Get housing starts data from FRED
-    Returns:
-        pd.DataFrame: DataFrame containing housing starts data
-    Raises:
-        ValueError: If FRED_API_KEY is not set in environment variables
-        Exception: For any FRED API related errors
-    """
-    fred_api_key = os.getenv("FRED_API_KEY")
-    if not fred_api_key:
-        raise ValueError("FRED_API_KEY environment variable is not set")
-    try:
-        fred = fredapi.Fred(api_key=fred_api_key)
-        fetch_years = years + 1 if years == 1 else years # Fetch an extra year when years=1
-        # Calculate start date 5 years ago
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-        data = fred.get_series("HOUST", observation_start=start_date)
-        data = pd.DataFrame(data, columns=["Housing Starts"])
-        data.index = pd.to_datetime(data.index)
-        data.index = data.index.tz_localize(None)  # Make dates timezone naive
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch FRED data: {str(e)}")
-
-def get_10yr_treasury_data(years: int) -> pd.DataFrame:
-    """Get 10-year Treasury yield data from FRED
+def _yoy_pct(values: np.ndarray, n: int) -> np.ndarray:
+    """Percent change of each element versus the element n positions earlier
+
+    Args:
+        values (np.ndarray): Series values in chronological order, either 1-D or
+            2-D with one column per series
+        n (int): Lag in observations
+
     Returns:
-        pd.DataFrame: DataFrame containing 10-year Treasury yield data
-    Raises:
-        ValueError: If FRED_API_KEY is not set in environment variables
-        Exception: For any FRED API related errors
+        np.ndarray: Percent changes in the input's float precision, NaN for the first n
+            entries and any non-finite result
     """
-    fred_api_key = os.getenv("FRED_API_KEY")
-    if not fred_api_key:
-        raise ValueError("FRED_API_KEY environment variable is not set")
-    try:
-        fred = fredapi.Fred(api_key=fred_api_key)
-        fetch_years = years + 1 if years == 1 else years # Fetch an extra year when years=1
-        # Calculate start date x years ago
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-        data = fred.get_series("GS10", observation_start=start_date)
-        data = pd.DataFrame(data, columns=["10-Year Treasury"])
-        data.index = pd.to_datetime(data.index)
-        data.index = data.index.tz_localize(None)  # Make dates timezone naive
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch FRED data: {str(e)}")
-
-def calculate_yoy(data: pd.DataFrame, column: str = "Close") -> pd.DataFrame:
+    values = values.astype(np.result_type(values.dtype, np.float32), copy=False)  # Keep float32 inputs in float32
+
+    yoy = np.empty(values.shape, dtype=values.dtype)
+    yoy[:n] = np.nan
+    # In-place ufuncs keep this to one output buffer and no temporaries
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(values[n:], values[:-n], out=yoy[n:])
+    yoy[n:] -= 1.0
+    yoy[n:] *= 100.0
+    yoy[~np.isfinite(yoy)] = np.nan  # Mask divisions by zero or missing values in one pass
+    return yoy
+
+def calculate_yoy(data: pd.DataFrame, column: str = "Close", periods: int = 252) -> pd.DataFrame:
     """Calculate year-over-year changes for financial data
     
     Args:
         data (pd.DataFrame): DataFrame containing financial data
         column (str): Column name to calculate YoY changes for
+        periods (int): Number of observations per year (252 trading days, 12 for monthly series)
     
     Returns:
         pd.DataFrame: DataFrame with added YoY change column
@@ -133,10 +63,24 @@ def calculate_yoy(data: pd.DataFrame, column: str = "Close") -> pd.DataFrame:
     """
     if column not in data.columns:
         raise ValueError(f"Input data must contain '{column}' column")
-    
-    data["YoY"] = data[column].pct_change(252) * 100  # Approximately 252 trading days per year
+
+    data["YoY"] = _yoy_pct(data[column].to_numpy(), periods)
     return data
 
+def calculate_yoy_frame(data: pd.DataFrame, periods: int = 12) -> pd.DataFrame:
+    """Calculate year-over-year changes for every column of a DataFrame
+
+    Args:
+        data (pd.DataFrame): DataFrame with one column per series
+        periods (int): Number of observations per year (12 for monthly series)
+
+    Returns:
+        pd.DataFrame: YoY changes with the same index and columns as ``data``
+    """
+    # One call over the 2-D block rather than one per column; the vectorized NumPy
+    # kernel handles every column at once
+    return pd.DataFrame(_yoy_pct(data.to_numpy(), periods), index=data.index, columns=data.columns)
+
 # Function to get the workspace folder
 def get_workspace_folder():
     """Get the workspace folder from environment or default to cwd."""
@@ -145,19 +89,130 @@ def get_workspace_folder():
     return workspace_folder
 
 
-def plot_data(kbe_data: pd.DataFrame, new_home_sales_data: pd.DataFrame, housing_starts_data: pd.DataFrame = None, treasury_data: pd.DataFrame = None, ticker: str="KBE") -> None:
-    """Plot ETF, new home sales, housing starts, and 10-year Treasury YoY changes
+def _pyplot():
+    """Import pyplot on first use so fetch-only code paths never load matplotlib
+
+    Selects the non-interactive Agg backend when there is no display to open a
+    window on, which skips GUI toolkit initialization on servers and in the Dev Container.
+    """
+    import matplotlib
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Plots are 12 inches wide at 100 dpi, so more points than this per line cannot be resolved
+PLOT_MAX_POINTS = 1200
+
+def _plot_arrays(data: pd.DataFrame, column: str):
+    """Return a frame's index and column as NumPy arrays for plotting
+
+    NaN rows are dropped: the first year of a YoY series, and in a combined
+    frame the dates that only other series have. This keeps each line
+    continuous and spares matplotlib from carrying the gaps through autoscaling.
+    Long series are then decimated to about PLOT_MAX_POINTS: each bucket of
+    consecutive points keeps only its minimum and maximum, so spikes survive,
+    and the first and last points are always kept.
+
+    Args:
+        data (pd.DataFrame): DataFrame to plot
+        column (str): Column to use for the y values
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: x and y arrays
+    """
+    x = data.index.to_numpy()
+    y = data[column].to_numpy()
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    n = len(y)
+    if n > PLOT_MAX_POINTS:
+        size = -(-n // (PLOT_MAX_POINTS // 2))  # ceiling division; two points kept per bucket
+        # Pad the last bucket with NaN so the buckets form a 2-D block
+        buckets = np.concatenate([y, np.full(-n % size, np.nan, dtype=y.dtype)]).reshape(-1, size)
+        offsets = np.arange(0, n, size)
+        keep = np.unique(np.concatenate([
+            offsets + np.nanargmin(buckets, axis=1),
+            offsets + np.nanargmax(buckets, axis=1),
+            [0, n - 1],
+        ]))  # sorted, so the points stay in date order
+        x, y = x[keep], y[keep]
+    return x, y
+
+
+def _new_figure(out_dir: str = None):
+    """Create the figure and primary axes for a plot
+
+    When plots only go to ``out_dir`` a bare Figure is used, which renders with
+    Agg directly and never touches pyplot's global state or a GUI backend.
+
+    Args:
+        out_dir (str): Directory plots are saved to without being displayed
+
+    Returns:
+        tuple: Figure and its primary Axes
+    """
+    if out_dir is not None:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(12, 6))
+        return fig, fig.subplots()
+    return _pyplot().subplots(figsize=(12, 6))
+
+
+def _save_and_show(fig, filename: str, out_dir: str = None, wait: bool = False) -> None:
+    """Save a figure and, unless saving to ``out_dir``, try to display it
+
+    Args:
+        fig: Figure to save
+        filename (str): File name for the saved plot
+        out_dir (str): Directory to save into without displaying the plot
+        wait (bool): Show the plot without blocking and wait for Enter before closing it
+    """
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+        plot_path = os.path.join(out_dir, filename)
+        fig.savefig(plot_path, dpi=100, bbox_inches="tight")
+        print(f"Plot saved to {plot_path}")
+        return
+
+    plt = _pyplot()
+
+    # Save the plot to a file
+    plot_path = filename if not is_devcontainer() else os.path.join(get_workspace_folder(), filename)  # Adjust path based on your WORKDIR in Dockerfile
+    fig.savefig(plot_path, dpi=100, bbox_inches="tight")
+    print(f"Plot saved to {plot_path}")
+
+    # Attempt to show the plot when an interactive backend is available
+    if plt.get_backend().lower() != "agg":
+        try:
+            plt.show(block=not wait)
+        except Exception as e:
+            print(f"Warning: Could not display plot ({str(e)}).")
+
+    # If in a Dev Container, inform the user
+    if is_devcontainer():
+        print("Note: Running in a Dev Container. The plot window won't display. Open the saved file at", plot_path, "in VS Code or copy it to your host machine.")
+
+    if wait:
+        input("\nPress Enter to return to menu...")
+    plt.close(fig)  # Close the figure to free memory
+
+
+INDICATOR_COLORS = {"New Home Sales": "red", "Housing Starts": "green", "10-Year Treasury": "purple"}
+
+def plot_data(yoy_data: pd.DataFrame, ticker: str="KBE", out_dir: str = None) -> None:
+    """Plot ETF YoY changes against new home sales, housing starts, and 10-year Treasury YoY changes
     
     Args:
-        kbe_data (pd.DataFrame): DataFrame containing KBE YoY data
-        new_home_sales_data (pd.DataFrame): DataFrame containing new home sales YoY data
-        housing_starts_data (pd.DataFrame): DataFrame containing housing starts YoY data
-        treasury_data (pd.DataFrame): DataFrame containing 10-year Treasury YoY data
+        yoy_data (pd.DataFrame): YoY changes with one column per series on a shared index;
+            the ETF column is named after the ticker, the rest are economic indicators
         ticker (str): Ticker symbol for ETF
+        out_dir (str): Directory to save the plot into without displaying it
     """
-    fig, ax1 = plt.subplots(figsize=(12, 6))
+    fig, ax1 = _new_figure(out_dir)
     
-    ax1.plot(kbe_data.index, kbe_data["YoY"], color="blue", label=f"{ticker} YoY Change")
+    ax1.plot(*_plot_arrays(yoy_data, ticker), color="blue", label=f"{ticker} YoY Change")
     ax1.set_xlabel("Date")
     ax1.set_ylabel("KBE YoY Change (%)", color="blue")
     ax1.tick_params(axis="y", labelcolor="blue")
@@ -165,14 +220,9 @@ def plot_data(kbe_data: pd.DataFrame, new_home_sales_data: pd.DataFrame, housing
 
     ax2 = ax1.twinx()
     
-    ax2.plot(new_home_sales_data.index, new_home_sales_data["YoY"],
-             color="red", label="New Home Sales YoY Change")
-    if housing_starts_data is not None:
-        ax2.plot(housing_starts_data.index, housing_starts_data["YoY"],
-                 color="green", label="Housing Starts YoY Change")
-    if treasury_data is not None:
-        ax2.plot(treasury_data.index, treasury_data["YoY"],
-                 color="purple", label="10-Year Treasury YoY Change")
+    for column in yoy_data.columns.drop(ticker):
+        ax2.plot(*_plot_arrays(yoy_data, column),
+                 color=INDICATOR_COLORS.get(column), label=f"{column} YoY Change")
     
     ax2.set_ylabel("Economic Indicators YoY Change (%)", color="red")
     ax2.tick_params(axis="y", labelcolor="red")
@@ -182,75 +232,26 @@ def plot_data(kbe_data: pd.DataFrame, new_home_sales_data: pd.DataFrame, housing
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(lines + lines2, labels + labels2, loc="upper left")
 
-    plt.title("KBE ETF, New Home Sales, Housing Starts, and 10-Year Treasury YoY Changes")
-    plt.tight_layout()
-
-    # Save the plot to a file
-    workspace_folder = get_workspace_folder()
-    plot_path = "housing_bank_etf_plot.png" if not is_devcontainer() else os.path.join(get_workspace_folder(), "housing_bank_etf_plot.png")  # Adjust path based on your WORKDIR in Dockerfile
-    plt.savefig(plot_path)
-    print(f"Plot saved to {plot_path}")
+    ax1.set_title("KBE ETF, New Home Sales, Housing Starts, and 10-Year Treasury YoY Changes")
+    fig.tight_layout()
 
-    # Attempt to show the plot
-    try:
-        plt.show()
-    except Exception as e:
-        print(f"Warning: Could not display plot ({str(e)}).")
+    _save_and_show(fig, "housing_bank_etf_plot.png", out_dir)
 
-    # If in a Dev Container, inform the user
-    if is_devcontainer():
-        print("Note: Running in a Dev Container. The plot window won't display. Open the saved file at", plot_path, "in VS Code or copy it to your host machine.")
 
-    plt.close()  # Close the figure to free memory
+RUSSELL_ETFS = ("IWM", "IWO")
 
+def plot_correlation(treasury_data: pd.DataFrame, etf_data: dict, out_dir: str = None) -> None:
+    """Plot inverse correlation between 10-year treasury and ETFs
 
-def get_etf_data(ticker: str, years: int=2) -> pd.DataFrame:
-    """Get ETF data from Yahoo Finance
-    
     Args:
-        ticker (str): ETF ticker symbol
-        years (int): Number of years of data to fetch
-        
-    Returns:
-        pd.DataFrame: DataFrame containing ETF historical data
+        treasury_data (pd.DataFrame): DataFrame containing 10-year Treasury yield data
+        etf_data (dict): ETF DataFrames keyed by ticker
+        out_dir (str): Directory to save the plot into without displaying it
     """
-    try:
-        fetch_years = years + 1 if years == 1 else years
-        end_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-
-        etf = yf.Ticker(ticker)
-        data = etf.history(start=start_date, end=end_date)
-        data.index = data.index.tz_localize(None)
-        if data.empty:
-            raise ValueError(f"No data returned for {ticker}")
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch {ticker} data: {str(e)}")
-
-def get_10yr_treasury_data(years: int=2) -> pd.DataFrame:
-    """Get 10-year Treasury yield data from FRED"""
-    fred_api_key = os.getenv("FRED_API_KEY")
-    if not fred_api_key:
-        raise ValueError("FRED_API_KEY environment variable is not set")
-    try:
-        fred = fredapi.Fred(api_key=fred_api_key)
-        fetch_years = years + 1 if years == 1 else years
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=365 * fetch_years)).strftime("%Y-%m-%d")
-        data = fred.get_series("GS10", observation_start=start_date)
-        data = pd.DataFrame(data, columns=["10-Year Treasury"])
-        data.index = pd.to_datetime(data.index)
-        data.index = data.index.tz_localize(None)
-        return data
-    except Exception as e:
-        raise Exception(f"Failed to fetch FRED data: {str(e)}")
-
-def plot_correlation(treasury_data: pd.DataFrame, etf_data: dict) -> None:
-    """Plot inverse correlation between 10-year treasury and ETFs"""
-    fig, ax1 = plt.subplots(figsize=(12, 6))
+    fig, ax1 = _new_figure(out_dir)
     
     # Plot treasury yields
-    ax1.plot(treasury_data.index, treasury_data["10-Year Treasury"], 
+    ax1.plot(*_plot_arrays(treasury_data, "10-Year Treasury"),
              color="blue", label="10-Year Treasury Yield")
     ax1.set_xlabel("Date")
     ax1.set_ylabel("10-Year Treasury Yield (%)", color="blue")
@@ -261,7 +262,7 @@ def plot_correlation(treasury_data: pd.DataFrame, etf_data: dict) -> None:
     
     # Plot ETF prices
     for ticker, data in etf_data.items():
-        ax2.plot(data.index, data["Close"], 
+        ax2.plot(*_plot_arrays(data, "Close"),
                  label=f"{ticker} Price")
     
     ax2.set_ylabel("ETF Price ($)", color="red")
@@ -272,27 +273,10 @@ def plot_correlation(treasury_data: pd.DataFrame, etf_data: dict) -> None:
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(lines + lines2, labels + labels2, loc="upper left")
 
-    plt.title("10-Year Treasury Yield vs Russell 2000 ETFs")
-    plt.tight_layout()
-
-    # Save the plot to a file
-    workspace_folder = get_workspace_folder()
-    plot_path = "10yr_russell_plot.png" if not is_devcontainer() else os.path.join(get_workspace_folder(), "10yr_russell_plot.png")
-    plt.savefig(plot_path)
-    print(f"Plot saved to {plot_path}")
-
-    # Attempt to show the plot
-    try:
-        plt.show(block=False)
-    except Exception as e:
-        print(f"Warning: Could not display plot ({str(e)}).")
-
-    # If in a Dev Container, inform the user
-    if is_devcontainer():
-        print("Note: Running in a Dev Container. The plot window won't display. Open the saved file at", plot_path, "in VS Code or copy it to your host machine.")
+    ax1.set_title("10-Year Treasury Yield vs Russell 2000 ETFs")
+    fig.tight_layout()
 
-    input("\nPress Enter to return to menu...")
-    plt.close()
+    _save_and_show(fig, "10yr_russell_plot.png", out_dir, wait=True)
 
 
 def display_menu() -> int:
@@ -310,113 +294,112 @@ def display_menu() -> int:
         except ValueError:
             print("Please enter a valid number")
 
+@functools.lru_cache(maxsize=1)
+def _init() -> None:
+    """One-time process setup for the CLI, skipped when the module is only imported"""
+    from dotenv import load_dotenv
+
+    # Load environment variables (FRED_API_KEY, ECON_DEBUG) from .env file
+    load_dotenv()
+
+# Economic indicators selectable for menu choice 1: CLI name -> FRED series id.
+# New home sales is always plotted; the others are optional overlays
+INDICATOR_SERIES = {
+    "newhome": "HSN1F",
+    "housestart": "HOUST",
+    "tenyear": "GS10",
+}
+
 def main():
 
     parser = argparse.ArgumentParser(description="Plot financial and economic data.")
     parser.add_argument("--years", type=int, default=10, help="Number of years for historical data (default: 10)")
-    parser.add_argument("--housestart", action="store_true", help="Plot housing starts data")
-    parser.add_argument("--tenyear", action="store_true", help="Plot 10-year Treasury data")
+    parser.add_argument("--series", nargs="*", default=[], choices=INDICATOR_SERIES,
+                        help="Economic indicators to plot alongside new home sales")
+    parser.add_argument("--housestart", action="store_true", help="Plot housing starts data (same as --series housestart)")
+    parser.add_argument("--tenyear", action="store_true", help="Plot 10-year Treasury data (same as --series tenyear)")
     parser.add_argument("--ticker", type=str, default="KBE", help="Ticker symbol to fetch data for (default: KBE)")
+    parser.add_argument("--out", type=str, default=None, metavar="DIR", help="Save plots into DIR without displaying them")
+    parser.add_argument("--verbose", action="store_true", help="Log this app's dataset date ranges and fetch retries; library logging stays at warnings (same as ECON_DEBUG=1)")
 
     args = parser.parse_args()
+    _init()
+
+    # One ordered, de-duplicated list of FRED series, whichever flags selected them
+    selected = ["newhome", *args.series]
+    if args.housestart:
+        selected.append("housestart")
+    if args.tenyear:
+        selected.append("tenyear")
+    series_ids = list(dict.fromkeys(INDICATOR_SERIES[name] for name in selected))
+
+    # Dataset date ranges are logged at debug level; pass --verbose or set ECON_DEBUG=1 to see them.
+    # Only this app's loggers go to DEBUG. The root logger stays at WARNING because
+    # urllib3 would log full FRED request URLs, API key included, and matplotlib floods
+    logging.basicConfig(level=logging.WARNING)
+    if args.verbose or os.getenv("ECON_DEBUG"):
+        for app_logger in (logger, logging.getLogger("data_sources"), logging.getLogger("cache")):
+            app_logger.setLevel(logging.DEBUG)
 
     years = args.years
     ticker = args.ticker
 
+    # One date window shared by every fetcher keeps the series aligned
+    today = datetime.date.today()
+    start_date = fetch_start_date(today, years)
+    end_date = today.strftime("%Y-%m-%d")
+
     while True:
         choice = display_menu()
         
         if choice == 1:
             try:
-
-
-                kbe_data = get_kbe_data(ticker, years)
-                new_home_sales_data = get_new_home_sales_data(years)
-
-                housing_starts_data = None
-                treasury_data = None
-
-                if args.housestart:
-                    housing_starts_data = get_housing_starts_data(years)
-                
-                if args.tenyear:
-                    treasury_data = get_10yr_treasury_data(years)
-
-                # Resample all dataframes to daily data using forward fill
-                new_home_sales_data = new_home_sales_data.resample('D').ffill()
-                if housing_starts_data is not None:
-                    housing_starts_data = housing_starts_data.resample('D').ffill()
-                if treasury_data is not None:
-                    treasury_data = treasury_data.resample('D').ffill()
-
-
-                # Calculate earliest start date from all of the data sources
-
-
-                all_start_dates = [kbe_data.index.min(), new_home_sales_data.index.min()]
-                if housing_starts_data is not None:
-                    all_start_dates.append(housing_starts_data.index.min())
-                if treasury_data is not None:
-                    all_start_dates.append(treasury_data.index.min())
-
-                earliest_start_date = min(all_start_dates)   
-            
-                print("Earliest start dates across datasets")
-                print(f"KBE Data: ", kbe_data.index.min())
-                print(f"New Home Sales Data: ", new_home_sales_data.index.min())
-                if housing_starts_data is not None:
-                    print(f"Housing Starts Data: ", housing_starts_data.index.min())
-                if treasury_data is not None:
-                    print(f"Treasury Data: ", treasury_data.index.min())
-
-
-                # Filter each dataframe by the latest start date.
-                kbe_data = kbe_data[kbe_data.index >= earliest_start_date]
-                new_home_sales_data = new_home_sales_data[new_home_sales_data.index >= earliest_start_date]
-
-                if housing_starts_data is not None:
-                    housing_starts_data = housing_starts_data[housing_starts_data.index >= earliest_start_date]
-
-                if treasury_data is not None:
-                    treasury_data = treasury_data[treasury_data.index >= earliest_start_date]
-
-                # Calculate YoY for all datasets now
+                # Yahoo Finance and FRED requests are independent, so overlap them.
+                # KBE and new home sales are required, so their errors are re-raised
+                # by result() into the handler below; an optional series that fails
+                # is left off the plot instead.
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    kbe_future = executor.submit(get_kbe_data, ticker, start_date, end_date)
+                    fred_futures = {
+                        series_id: executor.submit(get_fred_series, series_id, start_date)
+                        for series_id in series_ids
+                    }
+                    kbe_data = kbe_future.result()
+                    fred_frames = [fred_futures["HSN1F"].result()]
+                    for series_id in series_ids[1:]:
+                        try:
+                            fred_frames.append(fred_futures[series_id].result())
+                        except Exception as e:
+                            print(f"Warning: Skipping {FRED_SERIES[series_id]} ({str(e)}).")
+
+                # Combine the monthly FRED series into one frame sharing a single index
+                fred_data = pd.concat(fred_frames, axis=1)
+
+                # Calculate YoY for all datasets now; the FRED series are monthly
                 kbe_data = calculate_yoy(kbe_data)
-                new_home_sales_data = calculate_yoy(new_home_sales_data, column="New Home Sales")
-
-                if housing_starts_data is not None:
-                    housing_starts_data = calculate_yoy(housing_starts_data, column="Housing Starts")
-
-                if treasury_data is not None:
-                    treasury_data = calculate_yoy(treasury_data, column="10-Year Treasury")
-
-                """
-                # Shift FRED data to account for lag
-                new_home_sales_data.index = new_home_sales_data.index + pd.DateOffset(months=1)
-                if housing_starts_data is not None:
-                    housing_starts_data.index = housing_starts_data.index - pd.DateOffset(months=1)
-                if treasury_data is not None:
-                    treasury_data.index = treasury_data.index - pd.DateOffset(months=1)
-                """
-
-                # Shift FRED data for display, only using values from the filtered data set
-                new_home_sales_data.index = new_home_sales_data.index.map(lambda x: x + pd.DateOffset(months=1) if x >= earliest_start_date else x)
-                if housing_starts_data is not None:
-                    housing_starts_data.index = housing_starts_data.index.map(lambda x: x + pd.DateOffset(months=1) if x >= earliest_start_date else x)
-                if treasury_data is not None:
-                    treasury_data.index = treasury_data.index.map(lambda x: x + pd.DateOffset(months=1) if x >= earliest_start_date else x)
-
-
-
-                print("Latest Start Date:", earliest_start_date)
-                print("KBE Data End Date:", kbe_data.index.max())
-                print("New Home Sales Data End Date:", new_home_sales_data.index.max())
-                if housing_starts_data is not None:
-                    print("Housing Starts Data End Date:", housing_starts_data.index.max())
-                if treasury_data is not None:
-                    print("10-Year Treasury Data End Date:", treasury_data.index.max())
-                
-                plot_data(kbe_data, new_home_sales_data, housing_starts_data, treasury_data, ticker)
+                fred_yoy = calculate_yoy_frame(fred_data, periods=12)
+
+                # Shift FRED data forward a month for display, all series at once
+                fred_yoy.index = fred_yoy.index + pd.DateOffset(months=1)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Read each range once; every index is sorted, so the first and
+                    # last entries are the min and max. FRED dates are the shifted
+                    # ones the plot uses
+                    kbe_start, kbe_end = kbe_data.index[0], kbe_data.index[-1]
+                    fred_start, fred_end = fred_yoy.index[0], fred_yoy.index[-1]
+                    logger.debug("Earliest start dates across datasets")
+                    logger.debug("KBE Data: %s", kbe_start)
+                    logger.debug("FRED Data: %s", fred_start)
+                    logger.debug("Latest Start Date: %s", max(kbe_start, fred_start))  # where both series overlap
+                    logger.debug("KBE Data End Date: %s", kbe_end)
+                    logger.debug("FRED Data End Date: %s", fred_end)
+
+                # Align every YoY series on one index; the daily ETF and monthly FRED
+                # dates are unioned once rather than matched per series
+                yoy_data = pd.concat([kbe_data["YoY"].rename(ticker), fred_yoy], axis=1, sort=True)
+
+                plot_data(yoy_data, ticker, args.out)
 
             except Exception as e:
                 print(f"\nError: {str(e)}")
@@ -424,17 +407,16 @@ def main():
 
 
         elif choice == 2:
-            # Get 2 years of data
-            treasury_data = get_10yr_treasury_data(years)
-            
-            # Get Russell 2000 ETFs data
-            etf_data = {
-                "IWM": get_etf_data("IWM", years),
-                "IWO": get_etf_data("IWO", years)
-            }
+            # Get treasury and Russell 2000 ETFs data concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                treasury_future = executor.submit(get_fred_series, "GS10", start_date)
+                etfs_future = executor.submit(get_etfs_data, RUSSELL_ETFS, start_date, end_date)
+                treasury_data = treasury_future.result()
+                etfs_data = etfs_future.result()
+            etf_data = {etf: etfs_data[etf] for etf in RUSSELL_ETFS}
             
             # Plot correlation
-            plot_correlation(treasury_data, etf_data)
+            plot_correlation(treasury_data, etf_data, args.out)
             
         elif choice == 3:
             print("Exiting program...")